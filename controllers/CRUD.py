@@ -24,6 +24,19 @@ class Controller(object):
         """
         return self.factory.load_by_uuid(uuid)
 
+    @require_role([Security.ROLE_COUNCIL_ADMIN, Security.ROLE_UNIT_ADMIN, Security.ROLE_GUARDIAN])
+    def get_many(self, uuids):
+        """Get multiple
+
+        Args:
+            uuids: list of strings
+        Returns:
+            list of objects, in the order requested; UUIDs with no record
+            are skipped
+        """
+        items = self.factory.get_persister().batch_get(uuids)
+        return [self.factory.construct(item) for item in items]
+
     @require_role([Security.ROLE_COUNCIL_ADMIN, Security.ROLE_UNIT_ADMIN, Security.ROLE_GUARDIAN])
     def set(self, data):
         """Record-level create/update
@@ -32,11 +45,21 @@ class Controller(object):
             data: dict containing the data; will REPLACE any existing
                 record in its entirety
         Returns:
-            Updated object
+            Updated object (validated when persisted)
+        """
+        return self.factory.construct(data)
+
+    @require_role([Security.ROLE_COUNCIL_ADMIN, Security.ROLE_UNIT_ADMIN, Security.ROLE_GUARDIAN])
+    def set_many(self, data_list):
+        """Record-level create/update of multiple records
+
+        Args:
+            data_list: list of dicts containing the data; each will REPLACE
+                any existing record in its entirety
+        Returns:
+            list of updated objects (validated when persisted)
         """
-        obj = self.factory.construct(data)
-        obj.validate()
-        return obj
+        return [self.factory.construct(data) for data in data_list]
 
     @require_role([Security.ROLE_COUNCIL_ADMIN, Security.ROLE_UNIT_ADMIN, Security.ROLE_GUARDIAN])
     def update(self, data):
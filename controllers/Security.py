@@ -15,7 +15,7 @@ def user_has_permission(user, roles):
     the requested action.
     """
     # TO-DO: add unit tests for this
-    if roles is str:
+    if isinstance(roles, str):
         roles = [roles]
     if ROLE_COUNCIL_ADMIN in user.roles:
         # Council admins can do ANYTHING!
@@ -56,16 +56,24 @@ def user_has_guardian_permission(user, *args):
 
 
 def require_role(role):
-    """Decorator function to require the user to have a specific role to perform an action"""
+    """Decorator function to require the user to have a specific role to perform an action
+
+    Accepts a single role or a list of roles; either way they're converted to
+    a frozenset once, when the function is decorated.
+    """
+    if isinstance(role, str):
+        role = [role]
+    roles = frozenset(role)
+
     def wrap(func):  # pylint: disable=missing-docstring
         def inner(*args, **kwargs):  # pylint: disable=missing-docstring
-            if user_has_permission(args[0].user, role):
+            if user_has_permission(args[0].user, roles):
                 return func(*args, **kwargs)
             else:
                 # raise InsufficientPermissionException("You don't have authorization to perform the specified action.")
                 raise InsufficientPermissionException(
                     "You don't have authorization ({}) to perform the specified action ({}).".
-                    format(role, func.__name__)
+                    format(', '.join(sorted(roles)), func.__name__)
                 )
         return inner
     return wrap
@@ -32,6 +32,14 @@ def post(event, context):
     return obj.to_dict()
 
 
+def post_many(event, context):
+    """Lambda facade for Guardian.Controller.set_many method"""
+    controller = _get_controller(event, context)
+    objs = controller.set_many(event['data'])
+    GuardianModel.Persister().save_many(objs)
+    return [obj.to_dict() for obj in objs]
+
+
 def put(event, context):
     """Lambda facade for Guardian.Controller.update method"""
     controller = _get_controller(event, context)
@@ -15,7 +15,7 @@ class AdultApplications(Base.Object):
         self.org_uuid = ''
         self.data = {}
 
-    def get_validator(self):
+    def _make_validator(self):
         return Validator(self)
 
     @staticmethod
@@ -26,12 +26,11 @@ class AdultApplications(Base.Object):
 class Validator(Base.Validator):
     """AdultApplication validator"""
 
-    def get_field_requirements(self):
-        return {
-            'uuid': Base.FIELD_REQUIRED,
-            'status': Base.FIELD_REQUIRED,
-            'org_uuid': Base.FIELD_REQUIRED,
-        }
+    FIELD_REQUIREMENTS = {
+        'uuid': Base.FIELD_REQUIRED,
+        'status': Base.FIELD_REQUIRED,
+        'org_uuid': Base.FIELD_REQUIRED,
+    }
 
 
 class Factory(Base.Factory):
@@ -1,25 +1,151 @@
 """Base classes"""
 
+import binascii
+import copy
+import operator
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import reduce
+from uuid import UUID
+
 import boto3
-import shortuuid
+from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 
 from . import InvalidObjectException
 from . import MultipleMatchException
 from . import RecordNotFoundException
 
+try:
+    from amazondax import AmazonDaxClient
+except ImportError:
+    AmazonDaxClient = None  # pylint: disable=invalid-name
+
 FIELD_REQUIRED = 'required'
 FIELD_OPTIONAL = 'optional'
 
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+)
+
+BATCH_GET_MAX_KEYS = 100
+BATCH_GET_MAX_ATTEMPTS = 8
+BATCH_GET_RETRY_DELAY = 0.05  # seconds; doubled on each retry
+BATCH_GET_MAX_RETRY_DELAY = 2.0  # seconds
+
+_DYNAMODB = None
+_TABLES = {}
+_FIELDS = {}
+
+
+def _get_dynamodb():
+    """Get the DynamoDB resource
+
+    If the DAX_ENDPOINT environment variable is set, reads & writes go
+    through the DAX cluster at that endpoint (writes are write-through, so
+    the cache stays current).  Otherwise DynamoDB is used directly.
+    """
+    dax_endpoint = os.environ.get('DAX_ENDPOINT')
+    if dax_endpoint:
+        if not AmazonDaxClient:
+            raise Exception('SYSTEM ERROR: DAX_ENDPOINT is set but amazondax is not installed.')
+        return AmazonDaxClient.resource(endpoint_url=dax_endpoint)
+    return boto3.resource('dynamodb', config=DYNAMODB_CONFIG)
+
+
+def _get_shared_dynamodb():
+    """Get the DynamoDB resource shared by all Persisters
+
+    The DynamoDB resource and its Table objects are created once and shared
+    across all Persisters, so their HTTP connections get reused between
+    requests (and between Lambda invocations of a warm container).
+    """
+    global _DYNAMODB  # pylint: disable=global-statement
+    if not _DYNAMODB:
+        _DYNAMODB = _get_dynamodb()
+    return _DYNAMODB
+
+
+def _get_table(table_name):
+    """Get a (shared) DynamoDB Table"""
+    if table_name not in _TABLES:
+        _TABLES[table_name] = _get_shared_dynamodb().Table(table_name)
+    return _TABLES[table_name]
+
+
+def _chunked(items, size):
+    """Split a list into lists of at most size items"""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class _RandomPool(object):  # pylint: disable=too-few-public-methods
+    """Hands out random bytes from a buffer refilled by os.urandom
+
+    One os.urandom call covers hundreds of UUIDs.  take() is guarded by a
+    lock, so threads never get the same bytes.  The pool isn't meant to be
+    shared across a fork (Lambda doesn't fork); a forked child would hand out
+    the same bytes as its parent.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.buffer = b''
+        self.offset = 0
+        self.lock = threading.Lock()
+
+    def take(self, num_bytes):
+        """Returns the next num_bytes random bytes"""
+        with self.lock:
+            if self.offset + num_bytes > len(self.buffer):
+                self.buffer = os.urandom(self.size)
+                self.offset = 0
+            data = self.buffer[self.offset:self.offset + num_bytes]
+            self.offset += num_bytes
+        return data
+
+
+_RANDOM_POOL = _RandomPool(4096)
+
+
+def _uuid7():
+    """Generates a time-ordered (version 7) UUID
+
+    48 bits of Unix time in milliseconds followed by random bits, so UUIDs
+    generated later sort after earlier ones.
+    """
+    timestamp = int(time.time() * 1000) & 0xFFFFFFFFFFFF
+    value = (timestamp << 80) | int(binascii.hexlify(_RANDOM_POOL.take(10)), 16)
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return UUID(int=value)
+
 
 class Object(object):
     """Base class"""
 
+    # The validator is kept in a slot rather than the instance __dict__ so
+    # it's never mistaken for one of the object's data fields.
+    __slots__ = ('_validator',)
+
     def __init__(self):
-        pass
+        self._validator = None
+
+    def get_validator(self):
+        """Returns a Validator object for validation
+
+        The validator is created on first use and reused after that.
+        """
+        if not self._validator:
+            self._validator = self._make_validator()  # pylint: disable=assignment-from-no-return
+        return self._validator
 
-    def get_validator(self):  # pylint: disable=no-self-use
+    def _make_validator(self):  # pylint: disable=no-self-use
         """
-        Returns a Validator object for validation
+        Creates a Validator object for validation
 
         Must be defined by the child class.
         """
@@ -37,27 +163,28 @@ class Object(object):
 
     def to_dict(self):
         """Convert object to dict"""
-        data = {}
-        for key, val in self.__dict__.items():
-            if key[0] != '_':
-                data[key] = val
-            else:
-                data[key[1:]] = val
-        return data
+        return {key: getattr(self, key) for key in self.fields()}
 
     def fields(self):
-        """Return list of object properties"""
-        fields = []
-        for key, _ in self.__dict__.items():
-            if key[0] == '_':
-                fields.append(key[1:])
-            else:
-                fields.append(key)
-        return fields
+        """Return set of object properties
+
+        Properties are all defined in __init__, so they're only determined
+        once per class.
+        """
+        klass = self.__class__
+        if klass not in _FIELDS:
+            fields = []
+            for key, _ in self.__dict__.items():
+                if key[0] == '_':
+                    fields.append(key[1:])
+                else:
+                    fields.append(key)
+            _FIELDS[klass] = frozenset(fields)
+        return _FIELDS[klass]
 
     def get_uuid(self):
         """Generates a UUID"""
-        return "{}-{}".format(self.get_uuid_prefix(), shortuuid.uuid())
+        return self.get_uuid_prefix() + '-' + _uuid7().hex
 
     @staticmethod
     def get_uuid_prefix():
@@ -68,29 +195,33 @@ class Object(object):
 class Validator(object):
     """Validates data construct"""
 
+    FIELD_REQUIREMENTS = None
+
     def __init__(self, obj):
         self.obj = obj
 
-    def get_field_requirements(self):  # pylint: disable=no-self-use
+    def get_field_requirements(self):
         """
         Specify which fields are used, and whether they're required
 
-        Must be defined by the child class.
+        Must be defined by the child class, either by setting
+        FIELD_REQUIREMENTS (built once, with the class) or, if the
+        requirements depend on the object's state, by overriding this method.
         """
-        raise Exception('SYSTEM ERROR: field requirements not defined.')
+        if self.FIELD_REQUIREMENTS is None:
+            raise Exception('SYSTEM ERROR: field requirements not defined.')
+        return self.FIELD_REQUIREMENTS
 
     def _validate_required_fields(self):
         """Validate that the data provided includes all required fields"""
-        valid = True
         errors = []
 
-        for key, value in self.get_field_requirements().items():
-            if value == FIELD_REQUIRED:
-                if key not in self.obj.to_dict() or not self.obj.to_dict()[key]:
-                    errors.append('Missing required field "{}"'.format(key))
-                    valid = False
+        data = self.obj.to_dict()
+        for key, requirement in self.get_field_requirements().items():
+            if requirement == FIELD_REQUIRED and not data.get(key):
+                errors.append('Missing required field "{}"'.format(key))
 
-        return (valid, errors)
+        return (not errors, errors)
 
     def prepare_for_validate(self):
         """
@@ -130,10 +261,24 @@ class Factory(object):
 
     def __init__(self):
         self.__persister = None
+        self._record_cache = {}
 
     def load_by_uuid(self, uuid):
-        """Load by UUID"""
-        return self.load_from_database({'uuid': uuid})
+        """Load by UUID
+
+        Records are cached for the life of the factory (typically a single
+        request), so loading the same UUID again doesn't go back to the DB.
+        Each call constructs a new object from a deep copy of the record, so
+        changes to one loaded object (including nested lists & dicts) don't
+        show up in later loads.
+        """
+        if uuid not in self._record_cache:
+            self._record_cache[uuid] = self._persister.get({'uuid': uuid})
+        return self.construct(copy.deepcopy(self._record_cache[uuid]))
+
+    def clear_cache(self):
+        """Forget any records cached by load_by_uuid"""
+        self._record_cache.clear()
 
     @classmethod
     def get_uuid_prefix(cls):
@@ -158,12 +303,14 @@ class Factory(object):
         """Create object from dict"""
         klass = self._get_object_class()  # pylint: disable=assignment-from-no-return
         obj = klass()
+        fields = obj.fields()
 
-        for key, _ in data.items():
-            if key in obj.fields():
+        for key, value in data.items():
+            if key in fields:
                 try:
-                    setattr(obj, key, data[key])
+                    setattr(obj, key, value)
                 except AttributeError:
+                    # read-only (derived) properties, e.g. Organization.uuid
                     pass
             else:
                 if invalid_field_exceptions:
@@ -191,8 +338,7 @@ class Persister(object):
     """Persists objects"""
 
     def __init__(self):
-        dynamodb = boto3.resource('dynamodb')
-        self.table = dynamodb.Table(self._get_table_name())
+        self.table = _get_table(self._get_table_name())
 
     def save(self, obj):
         """Save to DB"""
@@ -200,6 +346,26 @@ class Persister(object):
         persist_obj = self.__class__.get_persistable_object(obj)
         self.table.put_item(Item=persist_obj)
 
+    def save_many(self, objs):
+        """Save multiple objects to DB
+
+        Every object is validated before anything is written, so one invalid
+        object means none are saved.  The writes then go through a batch
+        writer, which groups them into batches (up to 25 items per request)
+        and resends any unprocessed items.  If the same uuid appears more
+        than once, the last one wins, as it would with repeated save() calls.
+
+        Returns:
+            int: number of objects saved
+        """
+        objs = list(objs)
+        for obj in objs:
+            obj.get_validator().validate()
+        with self.table.batch_writer(overwrite_by_pkeys=['uuid']) as batch:
+            for obj in objs:
+                batch.put_item(Item=self.__class__.get_persistable_object(obj))
+        return len(objs)
+
     @staticmethod
     def get_persistable_object(obj):
         """
@@ -208,11 +374,7 @@ class Persister(object):
         DynamoDB wants a dict, not an object
         DynamoDB won't store empty fields, so get rid of 'em
         """
-        new_dict = {}
-        for key, val in obj.to_dict().items():
-            if val != '':
-                new_dict[key] = val
-        return new_dict
+        return {key: val for key, val in obj.to_dict().items() if val != ''}
 
     def get(self, key):
         """Load from DB by primary key"""
@@ -222,19 +384,47 @@ class Persister(object):
         else:
             raise RecordNotFoundException('Record not found')
 
+    def batch_get(self, uuids):
+        """Load multiple records from DB by UUID
+
+        Fetched with BatchGetItem, 100 keys per request.  Unprocessed keys
+        (usually due to throttling) are re-requested with capped exponential
+        backoff, up to BATCH_GET_MAX_ATTEMPTS requests per chunk.  Records
+        are returned in the order requested; UUIDs with no record are skipped.
+        """
+        uuids = list(OrderedDict.fromkeys(uuids))
+        table_name = self._get_table_name()
+        items = {}
+        for chunk in _chunked(uuids, BATCH_GET_MAX_KEYS):
+            request = {table_name: {'Keys': [{'uuid': uuid} for uuid in chunk]}}
+            attempts = 0
+            while request:
+                if attempts >= BATCH_GET_MAX_ATTEMPTS:
+                    raise Exception('Error loading records: keys still unprocessed after retries')
+                if attempts:
+                    time.sleep(min(BATCH_GET_MAX_RETRY_DELAY, BATCH_GET_RETRY_DELAY * 2 ** (attempts - 1)))
+                attempts += 1
+                response = _get_shared_dynamodb().batch_get_item(RequestItems=request)
+                for item in response['Responses'].get(table_name, []):
+                    items[item['uuid']] = item
+                request = response.get('UnprocessedKeys')
+        return [items[uuid] for uuid in uuids if uuid in items]
+
     def query(self, search_data):
-        """Search DB with index and return 0 or more records"""
-        expression = None
-        if '__index__' in search_data:
-            index_name = search_data['__index__']
-            del search_data['__index__']
-        for key, value in search_data.items():
-            if not index_name:
-                index_name = key
-            if expression:
-                expression = expression & boto3.dynamodb.conditions.Key(key).eq(value)
-            else:
-                expression = boto3.dynamodb.conditions.Key(key).eq(value)  # pylint: disable=redefined-variable-type
+        """Search DB with index and return 0 or more records
+
+        The index is specified by the '__index__' key; if not specified, the
+        index is named after the (first) search key.
+        """
+        search_data = dict(search_data)
+        index_name = search_data.pop('__index__', None)
+        if not search_data:
+            raise Exception('Error searching: no search keys specified')
+        index_name = index_name or next(iter(search_data))
+        expression = reduce(
+            operator.and_,
+            (Key(key).eq(value) for key, value in search_data.items())
+        )
         result = self.table.query(
             IndexName=index_name,
             KeyConditionExpression=expression
@@ -0,0 +1,137 @@
+"""Bulk loading of records from CSV files"""
+import csv
+from multiprocessing.pool import ThreadPool
+
+from . import InvalidObjectException
+from . import User
+
+
+class Loader(object):
+    """Loads records from a CSV file straight into DynamoDB
+
+    Every row is constructed & validated before anything is written; if any
+    row is invalid, nothing is loaded and the error lists the bad rows by
+    row number.  (Records without a uuid column get a new UUID on every
+    load, so a partial load couldn't safely be re-run.)  The records are
+    then written with the persister's batch writer, up to 25 items per
+    request.
+    """
+
+    def __init__(self, factory, required_columns, persister=None):
+        """Dependency-injectable init
+
+        Args:
+            factory: Factory object for the records being loaded
+            required_columns: list of columns the file must include
+            persister: Persister object; defaults to the factory's
+        """
+        self.factory = factory
+        self.required_columns = required_columns
+        if persister:
+            self.persister = persister
+        else:
+            self.persister = factory.get_persister()
+
+    def load_file(self, filename):
+        """Load the records in a local CSV file
+
+        Args:
+            filename: name of local file
+        Returns:
+            int: number of records loaded
+        """
+        with open(filename) as data_file:
+            return self.load(data_file)
+
+    def load(self, data_file):
+        """Load the records in a CSV file
+
+        Args:
+            data_file: file containing data
+        Returns:
+            int: number of records loaded
+        """
+        reader = csv.DictReader(data_file)
+        self._validate_headers(reader)
+
+        objs = []
+        errors = []
+        row_num = 1
+        for row in reader:
+            row_num = row_num + 1
+            try:
+                obj = self.factory.construct(self._prepare_record(row))
+            except Exception as exc:  # pylint: disable=broad-except
+                errors.append('Row {}: {}'.format(row_num, exc))
+                continue
+            row_errors = self._get_errors(obj)
+            if row_errors:
+                errors.append('Row {}: {}'.format(row_num, row_errors[0]))
+            objs.append(obj)
+
+        if errors:
+            raise InvalidObjectException('Invalid file; nothing loaded.  ' + '  '.join(errors))
+        self._prepare_objects(objs)
+        return self.persister.save_many(objs)
+
+    def _validate_headers(self, reader):
+        columns = reader.fieldnames or []
+        for column in self.required_columns:
+            if column not in columns:
+                raise InvalidObjectException('Invalid file format.  Column "{}" not found.'.format(column))
+        fields = self.factory._get_object_class()().fields()  # pylint: disable=protected-access
+        for column in columns:
+            if column not in fields:
+                raise InvalidObjectException('Invalid file format.  Unknown column "{}".'.format(column))
+
+    def _get_errors(self, obj):  # pylint: disable=no-self-use
+        """Validation errors for the object built from a row
+
+        Can be extended by the child.
+        """
+        return obj.get_validator().get_validation_errors()
+
+    def _prepare_record(self, row):  # pylint: disable=no-self-use
+        """Convert a file row into record data
+
+        Drops empty cells, so the object's defaults apply.
+        """
+        return {key: value for key, value in row.items() if value != ''}
+
+    def _prepare_objects(self, objs):
+        """Last changes to the (valid) objects before they're written
+
+        Can be overridden by the child.
+        """
+        pass
+
+
+class UserLoader(Loader):
+    """Loads Users; plain-text passwords are hashed in a thread pool, pre-hashed values are stored unchanged"""
+
+    def __init__(self, factory=None, persister=None, hash_threads=6):
+        if not factory:
+            factory = User.Factory()
+        super(UserLoader, self).__init__(factory, ['username', 'password'], persister)
+        self.hash_threads = hash_threads
+
+    def _get_errors(self, obj):
+        errors = super(UserLoader, self)._get_errors(obj)
+        password = obj.password
+        if User.User.looks_like_password_hash(password) and not User.User.is_password_hash(password):
+            errors.append('Malformed password hash')
+        return errors
+
+    def _prepare_objects(self, objs):
+        """Hash any plain-text passwords"""
+        to_hash = [obj for obj in objs if not User.User.is_password_hash(obj.password)]
+        if not to_hash:
+            return
+        pool = ThreadPool(self.hash_threads)
+        try:
+            hashes = pool.map(User.User.get_password_hash, [obj.password for obj in to_hash])
+        finally:
+            pool.close()
+            pool.join()
+        for obj, password_hash in zip(to_hash, hashes):
+            obj.password = password_hash
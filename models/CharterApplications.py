@@ -12,7 +12,7 @@ class CharterApplications(Base.Object):
         self.year = 0
         self.status = ''
 
-    def get_validator(self):
+    def _make_validator(self):
         return Validator(self)
 
     @staticmethod
@@ -23,13 +23,12 @@ class CharterApplications(Base.Object):
 class Validator(Base.Validator):
     """CharterApplication validator"""
 
-    def get_field_requirements(self):
-        return {
-            'uuid': Base.FIELD_REQUIRED,
-            'sponsoring_organization_uuid': Base.FIELD_REQUIRED,
-            'year': Base.FIELD_REQUIRED,
-            'status': Base.FIELD_REQUIRED,
-        }
+    FIELD_REQUIREMENTS = {
+        'uuid': Base.FIELD_REQUIRED,
+        'sponsoring_organization_uuid': Base.FIELD_REQUIRED,
+        'year': Base.FIELD_REQUIRED,
+        'status': Base.FIELD_REQUIRED,
+    }
 
 
 class Factory(Base.Factory):
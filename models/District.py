@@ -13,7 +13,7 @@ class District(Organization.Object):
         self.type = Organization.ORG_TYPE_DISTRICT
         self.parent_uuid = 'cnl-'+COUNCIL_ID
 
-    def get_validator(self):
+    def _make_validator(self):
         return Validator(self)
 
     @staticmethod
@@ -24,13 +24,12 @@ class District(Organization.Object):
 class Validator(Base.Validator):
     """District validator"""
 
-    def get_field_requirements(self):
-        return {
-            'uuid': Base.FIELD_REQUIRED,
-            'type': Base.FIELD_REQUIRED,
-            'number': Base.FIELD_REQUIRED,
-            'name': Base.FIELD_REQUIRED,
-        }
+    FIELD_REQUIREMENTS = {
+        'uuid': Base.FIELD_REQUIRED,
+        'type': Base.FIELD_REQUIRED,
+        'number': Base.FIELD_REQUIRED,
+        'name': Base.FIELD_REQUIRED,
+    }
 
 
 class Factory(Base.Factory):
@@ -13,7 +13,7 @@ class Guardian(Base.Object):
         self.last_name = ''
         self.youth = []
 
-    def get_validator(self):
+    def _make_validator(self):
         return Validator(self)
 
     @staticmethod
@@ -24,14 +24,13 @@ class Guardian(Base.Object):
 class Validator(Base.Validator):
     """Guardian validator"""
 
-    def get_field_requirements(self):
-        return {
-            'uuid': Base.FIELD_REQUIRED,
-            'user_uuid': Base.FIELD_REQUIRED,
-            'first_name': Base.FIELD_REQUIRED,
-            'last_name': Base.FIELD_REQUIRED,
-            'youth': Base.FIELD_REQUIRED,
-        }
+    FIELD_REQUIREMENTS = {
+        'uuid': Base.FIELD_REQUIRED,
+        'user_uuid': Base.FIELD_REQUIRED,
+        'first_name': Base.FIELD_REQUIRED,
+        'last_name': Base.FIELD_REQUIRED,
+        'youth': Base.FIELD_REQUIRED,
+    }
 
 
 class Factory(Base.Factory):
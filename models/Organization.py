@@ -36,12 +36,6 @@ class Object(Base.Object):
         self._uuid = self.get_uuid()
         return self._uuid
 
-    def to_dict(self):
-        """Converts object to dict"""
-        data = super(Object, self).to_dict()
-        data['uuid'] = self.get_uuid()
-        return data
-
     def get_uuid(self):
         """Generates a UUID"""
         if not self.number:
@@ -26,7 +26,7 @@ class Session(Base.Object):
         """Get a session variable"""
         return self.data[var]
 
-    def get_validator(self):
+    def _make_validator(self):
         return Validator(self)
 
     @staticmethod
@@ -37,12 +37,11 @@ class Session(Base.Object):
 class Validator(Base.Validator):
     """Session validator"""
 
-    def get_field_requirements(self):
-        return {
-            'uuid': Base.FIELD_REQUIRED,
-            'expires': Base.FIELD_REQUIRED,
-            'data': Base.FIELD_REQUIRED,
-        }
+    FIELD_REQUIREMENTS = {
+        'uuid': Base.FIELD_REQUIRED,
+        'expires': Base.FIELD_REQUIRED,
+        'data': Base.FIELD_REQUIRED,
+    }
 
 
 class Factory(Base.Factory):
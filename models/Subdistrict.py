@@ -12,7 +12,7 @@ class Subdistrict(Organization.Object):
         self.type = Organization.ORG_TYPE_SUBDISTRICT
         self.parent_uuid = ''
 
-    def get_validator(self):
+    def _make_validator(self):
         return Validator(self)
 
     @staticmethod
@@ -23,14 +23,13 @@ class Subdistrict(Organization.Object):
 class Validator(Base.Validator):
     """Subdistrict Validator"""
 
-    def get_field_requirements(self):
-        return {
-            'uuid': Base.FIELD_REQUIRED,
-            'type': Base.FIELD_REQUIRED,
-            'parent_uuid': Base.FIELD_REQUIRED,
-            'number': Base.FIELD_REQUIRED,
-            'name': Base.FIELD_REQUIRED,
-        }
+    FIELD_REQUIREMENTS = {
+        'uuid': Base.FIELD_REQUIRED,
+        'type': Base.FIELD_REQUIRED,
+        'parent_uuid': Base.FIELD_REQUIRED,
+        'number': Base.FIELD_REQUIRED,
+        'name': Base.FIELD_REQUIRED,
+    }
 
 
 class Factory(Base.Factory):
@@ -21,7 +21,7 @@ class Unit(Organization.Object):
         self.lds_unit = True
         self.number = ''
 
-    def get_validator(self):
+    def _make_validator(self):
         return Validator(self)
 
     @staticmethod
@@ -32,13 +32,12 @@ class Unit(Organization.Object):
 class Validator(Organization.Validator):
     """Unit validator"""
 
-    def get_field_requirements(self):
-        return {
-            'uuid': Base.FIELD_REQUIRED,
-            'type': Base.FIELD_REQUIRED,
-            'name': Base.FIELD_REQUIRED,
-            'number': Base.FIELD_REQUIRED,
-        }
+    FIELD_REQUIREMENTS = {
+        'uuid': Base.FIELD_REQUIRED,
+        'type': Base.FIELD_REQUIRED,
+        'name': Base.FIELD_REQUIRED,
+        'number': Base.FIELD_REQUIRED,
+    }
 
     def _validate(self):
         valid_types = [
@@ -1,10 +1,21 @@
 """User classes"""
+import binascii
 import hashlib
+import hmac
+import os
 
 from . import AuthenticationFailureException
 from . import Base
 from . import MultipleMatchException
 
+PASSWORD_HASH_ALGORITHM = 'pbkdf2_sha256'
+PASSWORD_HASH_ITERATIONS = 260000
+PASSWORD_SALT_BYTES = 16
+
+# Verified against when the username isn't found, so that costs the same as
+# a wrong password (the digest doesn't matter; the work is the same)
+_DUMMY_PASSWORD_HASH = '{}${}${}${}'.format(PASSWORD_HASH_ALGORITHM, PASSWORD_HASH_ITERATIONS, '0' * 32, '0' * 64)
+
 
 class User(Base.Object):  # pylint: disable=too-many-instance-attributes
     """User class"""
@@ -21,12 +32,80 @@ class User(Base.Object):  # pylint: disable=too-many-instance-attributes
         self.positions = []
 
     @staticmethod
-    def get_password_hash(password):
-        """Hashes the password"""
-        hashed_password = hashlib.sha256(password).hexdigest()
-        return hashed_password
+    def get_password_hash(password, salt=None, iterations=PASSWORD_HASH_ITERATIONS):
+        """Hashes the password
+
+        Uses salted PBKDF2-HMAC-SHA256.  The iteration count is the cost knob;
+        it is stored with the hash, so it can be raised without invalidating
+        existing passwords.
+
+        Returns:
+            string: "algorithm$iterations$salt$hash"
+        """
+        if not isinstance(password, bytes):
+            password = password.encode('utf-8')
+        if salt is None:
+            salt = binascii.hexlify(os.urandom(PASSWORD_SALT_BYTES)).decode('ascii')
+        digest = hashlib.pbkdf2_hmac('sha256', password, salt.encode('ascii'), iterations)
+        return '{}${}${}${}'.format(
+            PASSWORD_HASH_ALGORITHM,
+            iterations,
+            salt,
+            binascii.hexlify(digest).decode('ascii'),
+        )
+
+    @staticmethod
+    def is_password_hash(value):
+        """Determines whether the value is a well-formed hash from get_password_hash"""
+        parts = value.split('$')
+        if len(parts) != 4:
+            return False
+        (algorithm, iterations, salt, digest) = parts
+        try:
+            return (
+                algorithm == PASSWORD_HASH_ALGORITHM and
+                iterations.isdigit() and int(iterations) > 0 and
+                bool(salt) and
+                len(digest) == 64 and len(binascii.unhexlify(digest)) == 32
+            )
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def looks_like_password_hash(value):
+        """Determines whether the value is meant to be a hash from get_password_hash"""
+        return value.startswith(PASSWORD_HASH_ALGORITHM + '$')
+
+    @staticmethod
+    def is_legacy_password_hash(password_hash):
+        """Determines whether the stored hash is a legacy (unsalted SHA-256) hash"""
+        try:
+            return len(password_hash) == 64 and len(binascii.unhexlify(password_hash)) == 32
+        except (TypeError, ValueError):
+            return False
 
-    def get_validator(self):
+    @staticmethod
+    def verify_password(password, password_hash):
+        """Determines whether the password matches the stored password hash
+
+        Legacy (unsalted SHA-256) hashes are still accepted; they get replaced
+        on the next successful log in (see Factory.load_by_username_password).
+        """
+        try:
+            if not isinstance(password, bytes):
+                password = password.encode('utf-8')
+            if User.is_legacy_password_hash(password_hash):
+                expected = hashlib.sha256(password).hexdigest()
+                return hmac.compare_digest(str(expected), str(password_hash).lower())
+            (algorithm, iterations, salt, _) = password_hash.split('$')
+            if algorithm != PASSWORD_HASH_ALGORITHM:
+                return False
+            expected = User.get_password_hash(password, salt, int(iterations))
+            return hmac.compare_digest(str(expected), str(password_hash))
+        except (AttributeError, TypeError, ValueError):
+            return False
+
+    def _make_validator(self):
         return Validator(self)
 
     @staticmethod
@@ -37,15 +116,14 @@ class User(Base.Object):  # pylint: disable=too-many-instance-attributes
 class Validator(Base.Validator):
     """User validator"""
 
-    def get_field_requirements(self):
-        return {
-            'uuid': Base.FIELD_REQUIRED,
-            'username': Base.FIELD_REQUIRED,
-            'password': Base.FIELD_REQUIRED,
-            'roles': Base.FIELD_OPTIONAL,
-            'positions': Base.FIELD_OPTIONAL,
-            'guardians': Base.FIELD_OPTIONAL,
-        }
+    FIELD_REQUIREMENTS = {
+        'uuid': Base.FIELD_REQUIRED,
+        'username': Base.FIELD_REQUIRED,
+        'password': Base.FIELD_REQUIRED,
+        'roles': Base.FIELD_OPTIONAL,
+        'positions': Base.FIELD_OPTIONAL,
+        'guardians': Base.FIELD_OPTIONAL,
+    }
 # TO-DO: UUID = usr-[USERNAME]
 
 
@@ -68,21 +146,42 @@ class Factory(Base.Factory):
             raise AuthenticationFailureException('Authentication failure.')
 
     def load_by_username_password(self, username, password):
-        """Load the user based on the username & password"""
+        """Load the user based on the username & password
+
+        Password hashes are salted, so the user is looked up by username and
+        the password is verified against the stored hash.  A legacy hash is
+        replaced with a current one once the password has been verified.
+        """
         search = {
             '__index__': 'username',
             'username': username,
-            'password': User.get_password_hash(password),
         }
-        data = self.get_persister().query(search)
+        data = self._persister.query(search)
         if len(data) == 1:
+            password_hash = data[0].get('password', '')
+            if not User.verify_password(password, password_hash):
+                raise AuthenticationFailureException('User not found.')
+            if User.is_legacy_password_hash(password_hash):
+                return self._upgrade_password_hash(data[0]['uuid'], password)
             user = self.construct(data[0])
             return user
         elif len(data) > 1:  # This should never happen.
             raise MultipleMatchException('System Error 5002.')
         else:
+            User.verify_password(password, _DUMMY_PASSWORD_HASH)
             raise AuthenticationFailureException('User not found.')
 
+    def _upgrade_password_hash(self, uuid, password):
+        """Re-hash a verified password and store it in place of a legacy hash
+
+        The full record is loaded first; the username index only holds keys.
+        """
+        user = self.load_by_uuid(uuid)
+        user.password = User.get_password_hash(password)
+        self._persister.save(user)
+        self._record_cache.pop(uuid, None)
+        return user
+
     @staticmethod
     def _get_object_class():
         return User
@@ -22,7 +22,7 @@ class Volunteer(Base.Object):  # pylint: disable=too-many-instance-attributes
         self.last_name = ''
         self.ssn = ''
 
-    def get_validator(self):
+    def _make_validator(self):
         return Validator(self)
 
     def get_record_hash(self):
@@ -43,18 +43,17 @@ class Validator(Base.Validator):
     def prepare_for_validate(self):
         self.obj.duplicate_hash = self.obj.get_record_hash()
 
-    def get_field_requirements(self):
-        return {
-            'uuid': Base.FIELD_REQUIRED,
-            'duplicate_hash': Base.FIELD_REQUIRED,
-            'unit_uuid': Base.FIELD_REQUIRED,
-            'scoutnet_id': Base.FIELD_OPTIONAL,
-            'application_uuid': Base.FIELD_OPTIONAL,
-            'ypt_completion_date': Base.FIELD_REQUIRED,
-            'first_name': Base.FIELD_REQUIRED,
-            'last_name': Base.FIELD_REQUIRED,
-            'ssn': Base.FIELD_REQUIRED,
-        }
+    FIELD_REQUIREMENTS = {
+        'uuid': Base.FIELD_REQUIRED,
+        'duplicate_hash': Base.FIELD_REQUIRED,
+        'unit_uuid': Base.FIELD_REQUIRED,
+        'scoutnet_id': Base.FIELD_OPTIONAL,
+        'application_uuid': Base.FIELD_OPTIONAL,
+        'ypt_completion_date': Base.FIELD_REQUIRED,
+        'first_name': Base.FIELD_REQUIRED,
+        'last_name': Base.FIELD_REQUIRED,
+        'ssn': Base.FIELD_REQUIRED,
+    }
 
 
 class Factory(Base.Factory):
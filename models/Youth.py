@@ -33,7 +33,7 @@ class Youth(Base.Object):  # pylint: disable=too-many-instance-attributes
         self.guardian_approval_signature = ''
         self.guardian_approval_date = ''
 
-    def get_validator(self):
+    def _make_validator(self):
         return YouthValidator(self)
 
     def get_record_hash(self):
@@ -62,19 +62,18 @@ class Youth(Base.Object):  # pylint: disable=too-many-instance-attributes
 class YouthValidator(Base.Validator):
     """Youth validator"""
 
+    FIELD_REQUIREMENTS = {
+        'uuid': Base.FIELD_REQUIRED,
+        'duplicate_hash': Base.FIELD_REQUIRED,
+        'units': Base.FIELD_REQUIRED,
+        'first_name': Base.FIELD_REQUIRED,
+        'last_name': Base.FIELD_REQUIRED,
+        'date_of_birth': Base.FIELD_REQUIRED,
+    }
+
     def prepare_for_validate(self):
         self.obj.duplicate_hash = self.obj.get_record_hash()
 
-    def get_field_requirements(self):
-        return {
-            'uuid': Base.FIELD_REQUIRED,
-            'duplicate_hash': Base.FIELD_REQUIRED,
-            'units': Base.FIELD_REQUIRED,
-            'first_name': Base.FIELD_REQUIRED,
-            'last_name': Base.FIELD_REQUIRED,
-            'date_of_birth': Base.FIELD_REQUIRED,
-        }
-
 
 class YouthFactory(Base.Factory):
     """Youth Factory"""
@@ -134,7 +133,7 @@ class Application(Base.Object):  # pylint: disable=too-many-instance-attributes
         self.last_name = ''
         self.date_of_birth = ''
 
-    def get_validator(self):
+    def _make_validator(self):
         return ApplicationValidator(self)
 
     @staticmethod
@@ -1,6 +1,8 @@
 # pylint: disable=no-member,attribute-defined-outside-init,import-error
 """General functionality for use across tests"""
 
+import hashlib
+
 from controllers import Security
 from models import COUNCIL_ID
 from models import Base
@@ -14,6 +16,10 @@ from models import User
 from models import Volunteer
 from models import Youth
 
+# Password hashing is deliberately slow, so only do it once
+BEN_PASSWORD_HASH = User.User.get_password_hash('ben')
+KEN_PASSWORD_HASH = User.User.get_password_hash('ken')
+
 
 class FakePersister(object):
     """Fake persister"""
@@ -38,11 +44,22 @@ class FakePersister(object):
         else:
             raise Base.RecordNotFoundException('No record found that matches requested criteria.')
 
+    def save(self, obj):
+        """Replaces (or adds) the test data record for the object"""
+        obj.validate()
+        record = Base.Persister.get_persistable_object(obj)
+        self.data = [item for item in self.data if item['uuid'] != obj.uuid] + [record]
+
+    def batch_get(self, uuids):
+        """Finds test data records by UUID"""
+        records = {item['uuid']: item for item in self.data}
+        return [records[uuid] for uuid in uuids if uuid in records]
+
     def query(self, search_data):
         """Finds test data records matching the search_data"""
         records = []
-        if '__index__' in search_data:
-            del search_data['__index__']
+        search_data = dict(search_data)
+        search_data.pop('__index__', None)
         for item in self.data:
             match = True
             for field_name, field_value in search_data.items():
@@ -73,7 +90,7 @@ class FakeUserPersister(FakePersister):
                 'first_name': 'Ben',
                 'last_name': 'Reece',
                 'username': 'ben',
-                'password': User.User.get_password_hash('ben'),
+                'password': BEN_PASSWORD_HASH,
                 'guardian_uuid': 'gdn-TEST-1',
                 'roles': {
                     Security.ROLE_COUNCIL_ADMIN: [],
@@ -82,7 +99,15 @@ class FakeUserPersister(FakePersister):
             {
                 'uuid': 'usr-ken',
                 'username': 'ken',
-                'password': User.User.get_password_hash('ken'),
+                'password': KEN_PASSWORD_HASH,
+                'roles': {
+                    Security.ROLE_GUARDIAN: [],
+                },
+            },
+            {
+                'uuid': 'usr-len',
+                'username': 'len',
+                'password': hashlib.sha256('len').hexdigest(),  # legacy hash
                 'roles': {
                     Security.ROLE_GUARDIAN: [],
                 },
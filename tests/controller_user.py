@@ -6,6 +6,7 @@ import unittest
 from controllers import ClientErrorException
 from controllers import User
 from models import AuthenticationFailureException
+from models import User as UserModel
 
 from . import FakeUserFactory
 
@@ -34,6 +35,12 @@ class TestUserController(unittest.TestCase):
         user = self.controller.get('usr-ben')
         self.assertEqual('Ben', user.first_name)
 
+    def test_get_many(self):
+        """Test get_many method"""
+        users = self.controller.get_many(['usr-ken', 'usr-nobody', 'usr-ben'])
+        self.assertEqual(['usr-ken', 'usr-ben'], [user.uuid for user in users])
+        self.assertEqual('Ben', users[1].first_name)
+
     def test_set(self):
         """Test set method"""
         data = {
@@ -46,6 +53,24 @@ class TestUserController(unittest.TestCase):
         self.assertNotEqual('', user.uuid)
         self.assertEqual('Ben', user.first_name)
 
+    def test_set_many(self):
+        """Test set_many method"""
+        data_list = [
+            {
+                'username': 'ben',
+                'first_name': 'Ben',
+                'password': 'foo',
+            },
+            {
+                'username': 'ken',
+                'first_name': 'Ken',
+                'password': 'bar',
+            },
+        ]
+        users = self.controller.set_many(data_list)
+        self.assertEqual(2, len(users))
+        self.assertEqual('Ken', users[1].first_name)
+
     def test_update(self):
         """Test update method"""
         data = self.controller.get('usr-ben').__dict__
@@ -80,5 +105,27 @@ class TestUserController(unittest.TestCase):
         with self.assertRaises(AuthenticationFailureException):
             controller.log_in('fred', 'flintstone')
 
+        with self.assertRaises(AuthenticationFailureException):
+            controller.log_in('ben', 'ken')
+
+    def test_login_legacy_password(self):
+        """Test 'log_in' with a legacy password hash, which gets upgraded"""
+        user_factory = FakeUserFactory()
+        controller = User.Controller(None, user_factory)
+
+        with self.assertRaises(AuthenticationFailureException):
+            controller.log_in('len', 'ken')
+
+        user_factory.load_by_uuid('usr-ben')
+        user = controller.log_in('len', 'len')
+        self.assertEqual('usr-len', user.uuid)
+        self.assertTrue(user.password.startswith(UserModel.PASSWORD_HASH_ALGORITHM + '$'))
+
+        stored = user_factory._persister.get({'uuid': 'usr-len'})  # pylint: disable=protected-access
+        self.assertEqual(user.password, stored['password'])
+        self.assertIn('usr-ben', user_factory._record_cache)  # pylint: disable=protected-access
+        self.assertNotIn('usr-len', user_factory._record_cache)  # pylint: disable=protected-access
+        self.assertEqual('usr-len', controller.log_in('len', 'len').uuid)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,12 +1,15 @@
 # pylint: disable=no-member,attribute-defined-outside-init,import-error
 """Tests models"""
 
+import threading
+import time
 import unittest
 
 from models import COUNCIL_ID
 from models import AdultApplications
 from models import CharterApplications
 from models import Guardian
+from models import RecordNotFoundException
 from models import SponsoringOrganization
 from models import Unit
 from models import User
@@ -14,6 +17,7 @@ from models import Volunteer
 from models import Youth
 
 from . import FakeSponsoringOrganizationFactory
+from . import FakeUserFactory
 from . import FakeYouthFactory
 from . import FakeYouthPersister
 
@@ -50,10 +54,87 @@ class TestUser(ModelTestCase):
         """Validate the UUID prefix"""
         self.assertEquals('usr', self.obj.uuid[0:3])
 
+    def test_uuid_ordering(self):
+        """UUIDs generated later should sort after earlier ones"""
+        first = User.User().uuid
+        time.sleep(0.002)
+        self.assertLess(first, User.User().uuid)
+
+    def test_uuid_threads(self):
+        """UUIDs generated concurrently should all be unique"""
+        uuids = []
+
+        def generate():  # pylint: disable=missing-docstring
+            for _ in range(500):
+                uuids.append(User.User().uuid)
+
+        threads = [threading.Thread(target=generate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(2000, len(set(uuids)))
+
+    def test_fields(self):
+        """Make sure fields are determined once per class"""
+        self.assertIn('username', self.obj.fields())
+        self.assertIs(self.obj.fields(), User.User().fields())
+
+    def test_validator(self):
+        """Make sure the validator is reused and isn't treated as a field"""
+        self.assertIs(self.validator, self.obj.get_validator())
+        self.assertNotIn('validator', self.obj.to_dict())
+
+    def test_load_by_uuid_cache(self):
+        """Make sure repeat loads by UUID come from the factory's cache"""
+        factory = FakeUserFactory()
+        first = factory.load_by_uuid('usr-ben')
+        factory._persister.data = []  # pylint: disable=protected-access
+        second = factory.load_by_uuid('usr-ben')
+        self.assertIsNot(first, second)
+        self.assertEqual(first.to_dict(), second.to_dict())
+
+        factory.clear_cache()
+        with self.assertRaises(RecordNotFoundException):
+            factory.load_by_uuid('usr-ben')
+
+    def test_load_by_uuid_cache_copies(self):
+        """Make sure changes to a loaded object don't leak into later loads"""
+        factory = FakeUserFactory()
+        first = factory.load_by_uuid('usr-ben')
+        first.roles['hacked'] = []
+        first.positions.append('hacked')
+        second = factory.load_by_uuid('usr-ben')
+        self.assertNotIn('hacked', second.roles)
+        self.assertEqual([], second.positions)
+
     def test_password(self):
         """Make sure passwords are being hashed correctly"""
-        hashed_password = '0f1128046248f83dc9b9ab187e16fad0ff596128f1524d05a9a77c4ad932f10a'
-        self.assertEquals(hashed_password, self.obj.get_password_hash('howdy'))
+        hashed_password = self.obj.get_password_hash('howdy')
+        self.assertTrue(hashed_password.startswith(User.PASSWORD_HASH_ALGORITHM + '$'))
+        self.assertNotEqual(hashed_password, self.obj.get_password_hash('howdy'))
+        self.assertTrue(self.obj.verify_password('howdy', hashed_password))
+        self.assertTrue(self.obj.verify_password(u'howdy', hashed_password))
+        self.assertFalse(self.obj.verify_password('rowdy', hashed_password))
+        self.assertFalse(self.obj.verify_password('howdy', '0f1128046248f83dc9b9ab187e16fad0'))
+        self.assertFalse(self.obj.verify_password('howdy', 'pbkdf2_sha256$many$abc$def'))
+        self.assertFalse(self.obj.verify_password('howdy', u'pbkdf2_sha256$1000$s\xe4lt$def'))
+        self.assertFalse(self.obj.verify_password('howdy', None))
+
+        legacy_hash = '0f1128046248f83dc9b9ab187e16fad0ff596128f1524d05a9a77c4ad932f10a'
+        self.assertTrue(self.obj.is_legacy_password_hash(legacy_hash))
+        self.assertFalse(self.obj.is_legacy_password_hash(hashed_password))
+        self.assertTrue(self.obj.is_password_hash(hashed_password))
+        self.assertFalse(self.obj.is_password_hash('pbkdf2_sha256$x$y$z'))
+        self.assertFalse(self.obj.is_password_hash(hashed_password[:-1] + 'g'))
+        self.assertFalse(self.obj.is_password_hash(legacy_hash))
+        self.assertTrue(self.obj.verify_password('howdy', legacy_hash))
+        self.assertTrue(self.obj.verify_password(u'howdy', legacy_hash.upper()))
+        self.assertFalse(self.obj.verify_password('rowdy', legacy_hash))
+        self.assertTrue(self.obj.verify_password(
+            u'h\xf6wdy',
+            self.obj.get_password_hash(u'h\xf6wdy'.encode('utf-8')),
+        ))
 
 
 class TestYouth(ModelTestCase):
@@ -0,0 +1,114 @@
+# pylint: disable=no-member,attribute-defined-outside-init,import-error
+"""Tests BulkLoader"""
+
+import os
+import unittest
+
+from models import BulkLoader
+from models import InvalidObjectException
+from models import User
+
+from . import FakeUserFactory
+
+
+class FakeBatchPersister(object):  # pylint: disable=too-few-public-methods
+    """Records what would have been written"""
+
+    def __init__(self):
+        self.saved = []
+
+    def save_many(self, objs):
+        """Validate & record the objects"""
+        num_saved = 0
+        for obj in objs:
+            obj.validate()
+            self.saved.append(obj)
+            num_saved += 1
+        return num_saved
+
+
+class TestUserLoader(unittest.TestCase):
+    """Tests UserLoader"""
+
+    def setUp(self):
+        self.persister = FakeBatchPersister()
+        self.loader = BulkLoader.UserLoader(FakeUserFactory(), self.persister)
+
+    def test_load_file(self):
+        """Tests the load_file method"""
+        filename = os.path.join(os.path.dirname(__file__), 'data/users.csv')
+        with self.assertRaises(InvalidObjectException) as context:
+            self.loader.load_file(filename)
+        self.assertIn('Row 3: Missing required field "password"', str(context.exception))
+        self.assertEqual(0, len(self.persister.saved))
+
+    def test_load(self):
+        """Tests the load method"""
+        filename = os.path.join(os.path.dirname(__file__), 'data/users.csv')
+        with open(filename) as data_file:
+            lines = data_file.readlines()
+        self.assertEqual(1, self.loader.load(lines[0:2]))
+
+        user = self.persister.saved[0]
+        self.assertEqual('usr', user.uuid[0:3])
+        self.assertEqual('Callie', user.first_name)
+        self.assertTrue(user.verify_password('secret', user.password))
+
+    def test_load_hashed_passwords(self):
+        """Pre-hashed passwords should be stored as-is"""
+        password_hash = User.User.get_password_hash('secret')
+        lines = [
+            'username,password\n',
+            'callie,{}\n'.format(password_hash),
+            'dallin,plain\n',
+        ]
+        self.assertEqual(2, self.loader.load(lines))
+        self.assertEqual(password_hash, self.persister.saved[0].password)
+        self.assertTrue(User.User.is_password_hash(self.persister.saved[1].password))
+        self.assertTrue(User.User.verify_password('plain', self.persister.saved[1].password))
+
+    def test_malformed_password_hash(self):
+        """Malformed pre-hashed passwords should be reported, not stored"""
+        lines = [
+            'username,password\n',
+            'callie,secret\n',
+            'dallin,pbkdf2_sha256$x$y$z\n',
+        ]
+        with self.assertRaises(InvalidObjectException) as context:
+            self.loader.load(lines)
+        self.assertIn('Row 3: Malformed password hash', str(context.exception))
+        self.assertEqual(0, len(self.persister.saved))
+
+    def test_missing_column(self):
+        """Tests a file missing a required column"""
+        filename = os.path.join(os.path.dirname(__file__), 'data/users_bad.csv')
+        with self.assertRaises(InvalidObjectException):
+            self.loader.load_file(filename)
+        self.assertEqual(0, len(self.persister.saved))
+
+    def test_unknown_column(self):
+        """Tests a file with a column the model doesn't have"""
+        lines = [
+            'username,password,email\n',
+            'callie,secret,callie@example.com\n',
+        ]
+        with self.assertRaises(InvalidObjectException) as context:
+            self.loader.load(lines)
+        self.assertIn('Unknown column "email"', str(context.exception))
+        self.assertEqual(0, len(self.persister.saved))
+
+    def test_extra_cell(self):
+        """Tests a row with more cells than the header has columns"""
+        lines = [
+            'username,password\n',
+            'callie,secret\n',
+            'dallin,secret,extra\n',
+        ]
+        with self.assertRaises(InvalidObjectException) as context:
+            self.loader.load(lines)
+        self.assertIn('Row 3: ', str(context.exception))
+        self.assertEqual(0, len(self.persister.saved))
+
+
+if __name__ == '__main__':
+    unittest.main()
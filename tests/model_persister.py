@@ -0,0 +1,264 @@
+# pylint: disable=no-member,attribute-defined-outside-init,import-error,protected-access
+"""Tests Base.Persister against fake DynamoDB resources"""
+
+import os
+import unittest
+
+from boto3.dynamodb.conditions import Key
+
+from models import Base
+from models import District
+from models import InvalidObjectException
+from models import Subdistrict
+from models import User
+
+
+class FakeBatchWriter(object):
+    """Buffers puts like boto3's BatchWriter, flushing them on exit"""
+
+    def __init__(self, table, overwrite_by_pkeys=None):
+        self.table = table
+        self.overwrite_by_pkeys = overwrite_by_pkeys
+        self.buffer = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        keys = [item['uuid'] for item in self.buffer]
+        if len(set(keys)) != len(keys):
+            raise Exception('Provided list of item keys contains duplicates')
+        self.table.items.extend(self.buffer)
+
+    def put_item(self, Item):  # pylint: disable=invalid-name
+        """Buffer the item; replaces a buffered item with the same keys, if asked"""
+        if self.overwrite_by_pkeys:
+            self.buffer = [
+                item for item in self.buffer
+                if [item[key] for key in self.overwrite_by_pkeys] != [Item[key] for key in self.overwrite_by_pkeys]
+            ]
+        self.buffer.append(Item)
+
+
+class FakeTable(object):
+    """Records written items and queries"""
+
+    def __init__(self):
+        self.items = []
+        self.queries = []
+
+    def batch_writer(self, overwrite_by_pkeys=None):
+        """Get a batch writer"""
+        return FakeBatchWriter(self, overwrite_by_pkeys)
+
+    def query(self, **kwargs):
+        """Record the query; finds nothing"""
+        self.queries.append(kwargs)
+        return {'Items': []}
+
+
+class FakeResource(object):  # pylint: disable=too-few-public-methods
+    """Serves BatchGetItem requests, leaving some keys unprocessed"""
+
+    def __init__(self, unprocessed_responses=1):
+        self.unprocessed_responses = unprocessed_responses
+        self.requested = []
+
+    def batch_get_item(self, RequestItems):  # pylint: disable=invalid-name
+        """Return the first key's record; the rest are unprocessed the first time(s)"""
+        keys = RequestItems['Users']['Keys']
+        self.requested.append([key['uuid'] for key in keys])
+        if self.unprocessed_responses:
+            self.unprocessed_responses -= 1
+            served, unprocessed = keys[:1], {'Users': {'Keys': keys[1:]}}
+        else:
+            served, unprocessed = keys, {}
+        return {
+            'Responses': {'Users': [{'uuid': key['uuid']} for key in served if key['uuid'] != 'usr-none']},
+            'UnprocessedKeys': unprocessed,
+        }
+
+
+class FakeDynamoDB(object):  # pylint: disable=too-few-public-methods
+    """Stands in for a DynamoDB (or DAX) resource, counting Tables made"""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.tables = []
+
+    def Table(self, name):  # pylint: disable=invalid-name
+        """Get a table"""
+        self.tables.append(name)
+        return FakeTable()
+
+
+class FakeAmazonDaxClient(object):  # pylint: disable=too-few-public-methods
+    """Stands in for amazondax.AmazonDaxClient"""
+
+    @staticmethod
+    def resource(**kwargs):
+        """Get a DAX resource"""
+        return FakeDynamoDB(dax=True, **kwargs)
+
+
+class TestSharedResource(unittest.TestCase):
+    """Tests the DynamoDB resource and Tables are shared by Persisters"""
+
+    def setUp(self):
+        self.saved = (Base._DYNAMODB, Base._TABLES, Base.boto3.resource, Base.AmazonDaxClient,
+                      os.environ.get('DAX_ENDPOINT'))
+        self.resources = []
+        Base._DYNAMODB = None
+        Base._TABLES = {}
+        Base.boto3.resource = self.make_resource
+        Base.AmazonDaxClient = FakeAmazonDaxClient
+        os.environ.pop('DAX_ENDPOINT', None)
+
+    def tearDown(self):
+        Base._DYNAMODB, Base._TABLES, Base.boto3.resource, Base.AmazonDaxClient, dax_endpoint = self.saved
+        if dax_endpoint is None:
+            os.environ.pop('DAX_ENDPOINT', None)
+        else:
+            os.environ['DAX_ENDPOINT'] = dax_endpoint
+
+    def make_resource(self, *args, **kwargs):
+        """Fake boto3.resource"""
+        resource = FakeDynamoDB(args=args, **kwargs)
+        self.resources.append(resource)
+        return resource
+
+    def test_shared(self):
+        """Test the resource is made once and each Table once per name"""
+        district = District.Persister()
+        subdistrict = Subdistrict.Persister()
+        user = User.Persister()
+        User.Persister()
+        self.assertEqual(1, len(self.resources))
+        self.assertEqual(('dynamodb',), self.resources[0].kwargs['args'])
+        self.assertIs(Base.DYNAMODB_CONFIG, self.resources[0].kwargs['config'])
+        self.assertEqual(['Organizations', 'Users'], self.resources[0].tables)
+        self.assertIs(district.table, subdistrict.table)
+        self.assertIsNot(district.table, user.table)
+
+    def test_dax(self):
+        """Test DAX_ENDPOINT selects the DAX resource"""
+        os.environ['DAX_ENDPOINT'] = 'dax://example.cluster'
+        User.Persister()
+        self.assertEqual([], self.resources)
+        self.assertEqual({'dax': True, 'endpoint_url': 'dax://example.cluster'}, Base._DYNAMODB.kwargs)
+        self.assertEqual(['Users'], Base._DYNAMODB.tables)
+
+    def test_dax_not_installed(self):
+        """Test DAX_ENDPOINT without amazondax is an error"""
+        os.environ['DAX_ENDPOINT'] = 'dax://example.cluster'
+        Base.AmazonDaxClient = None
+        with self.assertRaises(Exception) as context:
+            User.Persister()
+        self.assertIn('amazondax is not installed', str(context.exception))
+        self.assertEqual([], self.resources)
+        self.assertIsNone(Base._DYNAMODB)
+
+
+class TestPersister(unittest.TestCase):
+    """Tests Persister"""
+
+    def setUp(self):
+        self.table = FakeTable()
+        Base._TABLES['Users'] = self.table
+        self.persister = User.Persister()
+
+    def tearDown(self):
+        del Base._TABLES['Users']
+        Base._DYNAMODB = None
+
+    def test_batch_get(self):
+        """Test batch_get retries unprocessed keys, keeps order, and drops duplicates"""
+        resource = FakeResource()
+        Base._DYNAMODB = resource
+        items = self.persister.batch_get(['usr-2', 'usr-1', 'usr-none', 'usr-2', 'usr-3'])
+        self.assertEqual(['usr-2', 'usr-1', 'usr-3'], [item['uuid'] for item in items])
+        self.assertEqual(
+            [['usr-2', 'usr-1', 'usr-none', 'usr-3'], ['usr-1', 'usr-none', 'usr-3']],
+            resource.requested,
+        )
+
+    def test_batch_get_gives_up(self):
+        """Test batch_get stops retrying after BATCH_GET_MAX_ATTEMPTS"""
+        resource = FakeResource(unprocessed_responses=100)
+        Base._DYNAMODB = resource
+        retry_delay = Base.BATCH_GET_RETRY_DELAY
+        Base.BATCH_GET_RETRY_DELAY = 0
+        try:
+            with self.assertRaises(Exception):
+                self.persister.batch_get(['usr-%d' % i for i in range(20)])
+        finally:
+            Base.BATCH_GET_RETRY_DELAY = retry_delay
+        self.assertEqual(Base.BATCH_GET_MAX_ATTEMPTS, len(resource.requested))
+
+    def test_query(self):
+        """Test query picks the index, ANDs the keys, and leaves search_data alone"""
+        search = {'username': 'ben'}
+        self.assertEqual([], self.persister.query(search))
+        self.assertEqual({'username': 'ben'}, search)
+        self.assertEqual('username', self.table.queries[-1]['IndexName'])
+        self.assertEqual(Key('username').eq('ben'), self.table.queries[-1]['KeyConditionExpression'])
+
+        search = {'__index__': 'username-status', 'username': 'ben', 'status': 'active'}
+        self.persister.query(search)
+        self.assertEqual({'__index__': 'username-status', 'username': 'ben', 'status': 'active'}, search)
+        self.assertEqual('username-status', self.table.queries[-1]['IndexName'])
+        expression = self.table.queries[-1]['KeyConditionExpression'].get_expression()
+        self.assertEqual('AND', expression['operator'])
+        self.assertEqual(
+            sorted([('username', 'ben'), ('status', 'active')]),
+            sorted((condition.get_expression()['values'][0].name, condition.get_expression()['values'][1])
+                   for condition in expression['values']),
+        )
+
+    def test_query_without_keys(self):
+        """Test query refuses to search without any keys"""
+        for search in ({}, {'__index__': 'username'}):
+            with self.assertRaises(Exception) as context:
+                self.persister.query(search)
+            self.assertIn('no search keys', str(context.exception))
+        self.assertEqual([], self.table.queries)
+
+    def test_save_many(self):
+        """Test save_many method"""
+        factory = User.Factory()
+        objs = [
+            factory.construct({'username': 'ben', 'password': 'foo'}),
+            factory.construct({'username': 'ken', 'password': 'bar'}),
+        ]
+        self.assertEqual(2, self.persister.save_many(iter(objs)))
+        self.assertEqual(['ben', 'ken'], [item['username'] for item in self.table.items])
+
+    def test_save_many_duplicate_uuid(self):
+        """A repeated uuid should be written once, last one winning"""
+        factory = User.Factory()
+        objs = [
+            factory.construct({'uuid': 'usr-1', 'username': 'ben', 'password': 'foo'}),
+            factory.construct({'uuid': 'usr-2', 'username': 'ken', 'password': 'bar'}),
+            factory.construct({'uuid': 'usr-1', 'username': 'benjamin', 'password': 'foo'}),
+        ]
+        self.persister.save_many(objs)
+        self.assertEqual(
+            [('usr-2', 'ken'), ('usr-1', 'benjamin')],
+            [(item['uuid'], item['username']) for item in self.table.items],
+        )
+
+    def test_save_many_invalid(self):
+        """An invalid object mid-list means nothing gets written"""
+        factory = User.Factory()
+        objs = [
+            factory.construct({'username': 'ben', 'password': 'foo'}),
+            factory.construct({'username': 'ken'}),
+            factory.construct({'username': 'callie', 'password': 'bar'}),
+        ]
+        with self.assertRaises(InvalidObjectException):
+            self.persister.save_many(objs)
+        self.assertEqual([], self.table.items)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,9 +22,7 @@ def create_objects(module, source_data):
     factory = module.Factory()
     persister = module.Persister()
 
-    for data in source_data:
-        obj = factory.construct(data)
-        persister.save(obj)
+    persister.save_many([factory.construct(data) for data in source_data])
 
 
 def main():